@@ -13,6 +13,14 @@ Description:
 Requirements:
     • Python 3.x
     • Pillow library (`pip install Pillow`)
+      – Optional: Pillow-SIMD (`pip install pillow-simd`) is a drop-in replacement
+        with much faster resampling on CPUs with SSE4/AVX2.
+      – Optional: OpenCV (`pip install opencv-python`) is used to resize opaque
+        images when it is installed.
+      – Optional: PyTorch with CUDA resizes opaque images on the GPU when USE_CUDA
+        is set to True.
+      – RESAMPLE_FILTER only applies to the Pillow resize; the OpenCV and GPU
+        paths use their own interpolation for opaque images.
 
 Usage:
     1. Run the script without any arguments:
@@ -21,15 +29,21 @@ Usage:
     2. In the GUI window that appears:
        • Select one of the three formats from the "Format" dropdown.
        • Click "Browse…" next to "Input Image" to select your source.
-       • Click "Save As…" next to "Output PNG" to choose the save location.
-         – Ensure the filename ends with `.png` to preserve transparency.
+       • Click "Save As…" next to "Output Image" to choose the save location.
+         – Use `.png` (default) to preserve transparency. `.webp` (lossless) also keeps it;
+           `.jpg`/`.jpeg` saves faster but fills the padding with black.
+       • Choose "Fast save" (default) or "Small file" for the PNG compression.
        • Click the "Resize →" button to generate the resized image.
+       • Or click "Batch folder…" to resize every image in a folder into PNGs
+         in a separate output folder, using all CPU cores.
 
     3. A pop-up will confirm success or display any errors encountered.
 
 Notes:
     – The tool ignores any command-line arguments; always run it plainly.
-    – The input image is converted to RGBA and scaled to fit inside the chosen canvas, preserving its aspect ratio.
+    – The input image is scaled to fit inside the chosen canvas, preserving its aspect ratio.
+      Images smaller than the canvas are never enlarged; they keep their original size.
+      Transparency in the source (alpha band or palette transparency) is kept.
     – The image is centered on a transparent canvas that exactly matches the selected Instagram dimension set.
 
 Presets Provided:
@@ -38,46 +52,241 @@ Presets Provided:
     • Landscape (16:9)  : 1080 × 606 px
 """
 
+import functools
+import io
+import os
+import shutil
+import threading
 import tkinter as tk
-from tkinter import filedialog, messagebox
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from tkinter import filedialog, messagebox, ttk
 from PIL import Image, ImageOps
+from PIL import __version__ as PILLOW_VERSION
+
+# Optional: OpenCV's SIMD resize is used for opaque images when installed
+try:
+    import cv2
+    import numpy as np
+except ImportError:
+    cv2 = None
 
 # Instagram dimension presets: (label, width, height)
-PRESETS = {
-    "Square (1:1) 1080×1080": (1080, 1080),
-    "Portrait (4:5) 1080×1350": (1080, 1350),
-    "Landscape (16:9) 1080×606": (1080, 606),
-}
+PRESETS = [
+    ("Square (1:1) 1080×1080", 1080, 1080),
+    ("Portrait (4:5) 1080×1350", 1080, 1350),
+    ("Landscape (16:9) 1080×606", 1080, 606),
+]
+DEFAULT_PRESET = 1  # Portrait (4:5)
+
+# Input image extensions, used by the file dialog and batch folder mode
+INPUT_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".webp")
+
+# File dialog filters and dropdown labels, built once
+_INPUT_FILETYPES = (("Image files", ";".join("*" + ext for ext in INPUT_EXTENSIONS)), ("All files", "*.*"))
+_OUTPUT_FILETYPES = (("PNG", "*.png"), ("WebP", "*.webp"), ("JPEG (no transparency)", "*.jpg;*.jpeg"))
+_PRESET_KEYS = tuple(label for label, _, _ in PRESETS)
+
+# Resampling filter used to fit the image into the canvas with Pillow.
+# LANCZOS gives the best quality; BICUBIC or BILINEAR are faster.
+# It applies to images with transparency, and to opaque images only when
+# neither the GPU (USE_CUDA; antialiased bicubic) nor OpenCV (INTER_AREA)
+# is used. Images are only ever scaled down, never enlarged.
+try:
+    # For Pillow 9.0.0 and above
+    RESAMPLE_FILTER = Image.Resampling.LANCZOS
+except AttributeError:
+    # For older Pillow versions
+    RESAMPLE_FILTER = Image.LANCZOS
+
+# Set to True to resize opaque images on a CUDA GPU with PyTorch. Off by
+# default: importing torch costs seconds and hundreds of MB, which a CPU-only
+# install pays for nothing. Batch workers always stay on the CPU.
+USE_CUDA = False
+
+# Allow large camera/panorama inputs without DecompressionBomb warnings,
+# and ask before decoding anything above LARGE_IMAGE_PIXELS
+Image.MAX_IMAGE_PIXELS = 200_000_000
+LARGE_IMAGE_PIXELS = 50_000_000
+
+# Output formats picked from the output file extension; anything else is PNG
+OUTPUT_FORMATS = {".png": "PNG", ".jpg": "JPEG", ".jpeg": "JPEG", ".webp": "WEBP"}
+
+# PNG zlib compression levels: "Fast save" vs "Small file"
+FAST_COMPRESS_LEVEL = 1
+SMALL_COMPRESS_LEVEL = 6
+
+def is_pillow_simd():
+    """
+    Return True if the installed Pillow is Pillow-SIMD.
+    Pillow-SIMD releases carry a ".postN" suffix on the upstream version.
+    """
+    return ".post" in PILLOW_VERSION
 
-def resize_with_transparent_bg(input_path, output_path, width, height):
+@functools.lru_cache(maxsize=8)
+def _blank_canvas(width, height):
     """
-    Resize an image to fit within a transparent canvas of specified size,
-    preserving aspect ratio and centering the result with transparent padding.
+    Return a cleared transparent canvas, built once per size.
+    Callers must copy it before drawing on it.
     """
-    try:
-        # Handle potential file opening issues
-        img = Image.open(input_path).convert("RGBA")
+    return Image.new("RGBA", (width, height), (0, 0, 0, 0))
 
-        # Handle resampling filter based on Pillow version
-        try:
-            # For Pillow 9.0.0 and above
-            img.thumbnail((width, height), Image.Resampling.LANCZOS)
-        except AttributeError:
-            # For older Pillow versions
-            img.thumbnail((width, height), Image.LANCZOS)
+def _fit_size(img, width, height):
+    """
+    Return the (width, height) that fits img inside width×height, rounded
+    like ImageOps.contain. Images that already fit keep their size.
+    """
+    scale = min(1, width / img.width, height / img.height)
+    new_w = max(1, min(width, round(img.width * scale)))
+    new_h = max(1, min(height, round(img.height * scale)))
+    return new_w, new_h
 
-        # Create transparent canvas
-        canvas = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+def _resize_cv2(img, width, height):
+    """
+    Fit an opaque RGB or L image inside width×height with OpenCV, which releases
+    the GIL. INTER_AREA gives clean, alias-free downscaling.
+    Images with alpha stay on Pillow, which resizes with premultiplied alpha.
+    """
+    arr = cv2.resize(np.asarray(img), _fit_size(img, width, height), interpolation=cv2.INTER_AREA)
+    return Image.fromarray(arr)
 
-        # Compute centered paste coordinates
-        x = (width - img.width) // 2
-        y = (height - img.height) // 2
+@functools.lru_cache(maxsize=None)
+def _cuda_torch():
+    """
+    Import PyTorch and return it if a CUDA GPU is usable, otherwise None.
+    A broken CUDA install raises OSError on import; treat it as unavailable.
+    """
+    try:
+        import torch
+    except (ImportError, OSError):
+        return None
+    return torch if torch.cuda.is_available() else None
 
-        # Paste with alpha
-        canvas.paste(img, (x, y), img)
+def _disable_cuda():
+    """
+    Process pool initializer: keep batch workers on the CPU so they don't each
+    import torch and create a CUDA context on the same GPU.
+    """
+    global USE_CUDA
+    USE_CUDA = False
 
-        # Save as PNG to preserve transparency
-        canvas.save(output_path, format="PNG")
+def _resize_cuda(torch, img, width, height):
+    """
+    Fit an opaque RGB or L image inside width×height on the GPU with antialiased
+    bicubic interpolation, which closely matches Pillow's downscaling.
+    """
+    import numpy as np
+    new_w, new_h = _fit_size(img, width, height)
+    x = torch.from_numpy(np.array(img)).to("cuda")
+    if x.dim() == 2:
+        x = x.unsqueeze(2)  # L images have no channel axis
+    x = x.permute(2, 0, 1).unsqueeze(0).float()
+    x = torch.nn.functional.interpolate(x, size=(new_h, new_w), mode="bicubic",
+                                        align_corners=False, antialias=True)
+    x = x.round_().clamp_(0, 255).to(torch.uint8).squeeze(0).permute(1, 2, 0)
+    arr = x.cpu().numpy()
+    return Image.fromarray(arr[:, :, 0] if img.mode == "L" else arr)
+
+def resize_with_transparent_bg(input_path, output_path, width, height,
+                               compress_level=FAST_COMPRESS_LEVEL):
+    """
+    Resize an image to fit within a transparent canvas of specified size,
+    preserving aspect ratio and centering the result with transparent padding.
+    The output format follows the extension of output_path (see OUTPUT_FORMATS).
+    compress_level is the PNG zlib level (1 = fastest, 9 = smallest).
+    """
+    output_format = OUTPUT_FORMATS.get(os.path.splitext(output_path)[1].lower(), "PNG")
+    try:
+        # Handle potential file opening issues; the file and decoder are
+        # released as soon as the pixels are decoded
+        with Image.open(input_path) as src:
+            # Already the right size with alpha: nothing to resize or pad
+            exact_fit = src.size == (width, height) and src.mode == "RGBA"
+            if exact_fit and src.format == "PNG" and output_format == "PNG":
+                # Already a valid output file; copy the bytes unless it is the same file
+                if os.path.abspath(input_path) != os.path.abspath(output_path):
+                    shutil.copyfile(input_path, output_path)
+                return True
+
+            # Let libjpeg downscale large JPEGs while decoding; keep 2x the
+            # target size so the final resize still has detail to work with
+            if src.format == "JPEG" and min(src.width // width, src.height // height) >= 2:
+                src.draft("RGB", (width * 2, height * 2))
+
+            # Images with an alpha band or a transparency key keep their alpha;
+            # opaque images are resized as RGB
+            has_alpha = "A" in src.getbands() or "transparency" in src.info
+
+            # Decode into an image that outlives the source file. Opaque
+            # grayscale stays single-channel through the resize; the RGBA
+            # expansion happens on the fitted image when it is pasted
+            if exact_fit:
+                img = src.copy()
+            elif has_alpha:
+                img = src.convert("RGBA")
+            else:
+                img = src.convert("L" if src.mode in ("1", "L") else "RGB")
+            img.load()
+
+        if not exact_fit:
+            # Lanczos taps are recomputed on every resize and their count grows
+            # with the scale factor; box-reduce by a whole factor first so the
+            # Lanczos pass only covers the last 2-4x of a large downscale
+            factor = min(img.width // (width * 2), img.height // (height * 2))
+            if factor >= 2:
+                img = img.reduce(factor)
+
+        if exact_fit:
+            # Re-encode only
+            canvas = img
+        elif has_alpha and (img.width > width or img.height > height):
+            # Fit and center in one call; pad() copies the pixels straight
+            # onto the transparent canvas, so the source alpha is kept as-is.
+            # Only used when shrinking, since pad() would also enlarge
+            canvas = ImageOps.pad(img, (width, height), method=RESAMPLE_FILTER,
+                                  color=(0, 0, 0, 0), centering=(0.5, 0.5))
+        else:
+            # Only shrink; images that already fit (and images with alpha,
+            # which only get here then) are pasted at their native size
+            if not has_alpha and (img.width > width or img.height > height):
+                torch = _cuda_torch() if USE_CUDA else None
+                if torch is not None:
+                    img = _resize_cuda(torch, img, width, height)
+                elif cv2 is not None:
+                    img = _resize_cv2(img, width, height)
+                else:
+                    # contain() returns a new image sized with the same rounding as pad()
+                    img = ImageOps.contain(img, (width, height), method=RESAMPLE_FILTER)
+
+            if output_format == "JPEG" and not has_alpha:
+                # JPEG has no alpha; build the canvas in RGB with black padding
+                canvas = Image.new("RGB", (width, height))
+            else:
+                # Create transparent canvas from the cached blank for this size
+                canvas = _blank_canvas(width, height).copy()
+
+            # Compute centered paste coordinates
+            x = (width - img.width) // 2
+            y = (height - img.height) // 2
+
+            # No mask: opaque pixels and source alpha are copied as-is
+            canvas.paste(img, (x, y))
+
+        # Encode in memory and write the file in a single call; outputs are
+        # a few MB at most, and a failed encode leaves no partial file
+        buf = io.BytesIO()
+        if output_format == "JPEG":
+            # JPEG has no alpha; the transparent padding becomes black
+            if canvas.mode != "RGB":
+                canvas = canvas.convert("RGB")
+            canvas.save(buf, format="JPEG", quality=90, optimize=False, progressive=False)
+        elif output_format == "WEBP":
+            # Lossless keeps transparency and pixels exact; method 0 is fastest
+            canvas.save(buf, format="WEBP", lossless=True, method=0)
+        else:
+            # Save as PNG to preserve transparency
+            canvas.save(buf, format="PNG", compress_level=compress_level, optimize=False)
+        with open(output_path, "wb") as fp:
+            fp.write(buf.getbuffer())
         return True
     except FileNotFoundError:
         raise FileNotFoundError(f"Could not find input file: {input_path}")
@@ -86,8 +295,88 @@ def resize_with_transparent_bg(input_path, output_path, width, height):
     except Exception as e:
         raise Exception(f"Error processing image: {str(e)}")
 
+def image_pixels(path):
+    """
+    Return the pixel count of an image from its header alone, without decoding.
+    Returns 0 if the file cannot be read; the conversion reports that error.
+    """
+    try:
+        with Image.open(path) as probe:
+            return probe.width * probe.height
+    except Exception:
+        return 0
+
+def batch_output_paths(input_paths, output_dir):
+    """
+    Return one PNG path in output_dir per input. Inputs sharing a file name
+    stem (photo.jpg, photo.png) get the source extension appended instead,
+    e.g. photo_jpg.png. A name that is still taken gets a numeric suffix
+    (photo_jpg_2.png), so no two outputs collide.
+    """
+    stems = [os.path.splitext(os.path.basename(path)) for path in input_paths]
+    # Compare case-insensitively so the names also stay apart on Windows/macOS
+    counts = {}
+    for stem, _ in stems:
+        counts[stem.lower()] = counts.get(stem.lower(), 0) + 1
+
+    used = set()
+    output_paths = []
+    for stem, ext in stems:
+        base = stem if counts[stem.lower()] == 1 else f"{stem}_{ext[1:]}"
+        name, n = base + ".png", 2
+        while name.lower() in used:
+            name, n = f"{base}_{n}.png", n + 1
+        used.add(name.lower())
+        output_paths.append(os.path.join(output_dir, name))
+    return output_paths
+
+def resize_batch(input_paths, output_paths, width, height,
+                 compress_level=FAST_COMPRESS_LEVEL, on_progress=None):
+    """
+    Resize many images in parallel, one worker process per CPU core.
+    on_progress(done, total) is called as each image finishes.
+    Returns a list of (input_path, error message) for the images that failed.
+    Raises ValueError before any work starts if two jobs share an output path
+    or an output path is also one of the inputs.
+    """
+    def key(path):
+        return os.path.normcase(os.path.abspath(path))
+
+    inputs = {key(path) for path in input_paths}
+    seen = set()
+    for out in output_paths:
+        if key(out) in inputs:
+            raise ValueError(f"Output would overwrite an input image: {out}")
+        if key(out) in seen:
+            raise ValueError(f"More than one image would be saved as: {out}")
+        seen.add(key(out))
+
+    failures = []
+    total = len(input_paths)
+    # Workers stay on the CPU: one CUDA context per core would exhaust the GPU,
+    # and CUDA cannot be used in forked children anyway
+    # The default worker count is os.cpu_count(), capped at 61 on Windows
+    with ProcessPoolExecutor(initializer=_disable_cuda) as executor:
+        futures = {
+            executor.submit(resize_with_transparent_bg, inp, out, width, height, compress_level): inp
+            for inp, out in zip(input_paths, output_paths)
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            try:
+                future.result()
+            except Exception as e:
+                failures.append((futures[future], str(e)))
+            if on_progress:
+                on_progress(done, total)
+    return failures
+
 # --- GUI Setup ---
 def main():
+    if is_pillow_simd():
+        print(f"Using Pillow-SIMD {PILLOW_VERSION}")
+    else:
+        print(f"Using Pillow {PILLOW_VERSION} (tip: `pip install pillow-simd` for faster resizing)")
+
     root = tk.Tk()
     root.title("Instagram Format Resizer")
     root.resizable(False, False)
@@ -102,11 +391,13 @@ def main():
     output_var = tk.StringVar()
     width_var = tk.StringVar()
     height_var = tk.StringVar()
-    preset_var = tk.StringVar(value="Portrait (4:5) 1080×1350")
+    preset_idx = tk.IntVar(value=DEFAULT_PRESET)
+    preset_var = tk.StringVar(value=_PRESET_KEYS[DEFAULT_PRESET])
+    compress_var = tk.IntVar(value=FAST_COMPRESS_LEVEL)
 
     # Callback: update width/height when preset changes
     def on_preset_change(*args):
-        w, h = PRESETS.get(preset_var.get(), PRESETS["Portrait (4:5) 1080×1350"])
+        w, h = PRESETS[preset_idx.get()][1:]
         width_var.set(str(w))
         height_var.set(str(h))
 
@@ -114,7 +405,7 @@ def main():
     def select_input():
         path = filedialog.askopenfilename(
             title="Select Input Image",
-            filetypes=[("Image files", "*.png;*.jpg;*.jpeg;*.bmp;*.gif;*.webp"), ("All files", "*.*")]
+            filetypes=_INPUT_FILETYPES
         )
         if path:
             input_var.set(path)
@@ -125,16 +416,33 @@ def main():
 
     def select_output():
         path = filedialog.asksaveasfilename(
-            title="Save as PNG (transparency)",
+            title="Save Resized Image (PNG keeps transparency)",
             defaultextension=".png",
-            filetypes=[("PNG", "*.png")]
+            filetypes=_OUTPUT_FILETYPES
         )
         if path:
-            # Ensure .png extension
-            if not path.lower().endswith('.png'):
+            # Ensure a supported extension, defaulting to .png
+            if os.path.splitext(path)[1].lower() not in OUTPUT_FORMATS:
                 path += '.png'
             output_var.set(path)
 
+    # Validate and return the canvas size, or None after showing an error
+    def get_dimensions():
+        try:
+            w = int(width_var.get())
+            h = int(height_var.get())
+            if w <= 0 or h <= 0:
+                raise ValueError("Dimensions must be positive")
+        except ValueError:
+            messagebox.showerror("Invalid Dimensions", "Width and height must be positive integers.")
+            return None
+        return w, h
+
+    def set_busy(busy):
+        state = tk.DISABLED if busy else tk.NORMAL
+        resize_button.config(state=state)
+        batch_button.config(state=state)
+
     # Process conversion
     def run_conversion():
         inp = input_var.get().strip()
@@ -145,35 +453,139 @@ def main():
             messagebox.showerror("Missing Paths", "Please select both input and output files.")
             return
 
-        try:
-            w = int(width_var.get())
-            h = int(height_var.get())
-            if w <= 0 or h <= 0:
-                raise ValueError("Dimensions must be positive")
-        except ValueError:
-            messagebox.showerror("Invalid Dimensions", "Width and height must be positive integers.")
+        dims = get_dimensions()
+        if dims is None:
             return
+        w, h = dims
+
+        # Read the header only and confirm before decoding very large inputs
+        pixels = image_pixels(inp)
+        if pixels > LARGE_IMAGE_PIXELS:
+            if not messagebox.askyesno(
+                "Large Image",
+                f"The input image is {pixels / 1_000_000:.0f} MP and may use a lot of memory.\n\nContinue?"
+            ):
+                return
 
         # Show processing indicator
         status_label.config(text="Processing...")
-        root.update_idletasks()
+        set_busy(True)
+        compress_level = compress_var.get()
+
+        # Run conversion off the Tk thread; widgets are only touched in on_done
+        def worker():
+            try:
+                resize_with_transparent_bg(inp, out, w, h, compress_level)
+                error = None
+            except Exception as e:
+                error = e
+            root.after(0, on_done, error)
+
+        def on_done(error):
+            set_busy(False)
+            if error is None:
+                status_label.config(text="Ready")
+                messagebox.showinfo("Success", f"Image successfully resized!\n\nSaved: {out}\nSize: {w}×{h}px")
+            else:
+                status_label.config(text="Error")
+                messagebox.showerror("Error", str(error))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    # Process every image in a folder, saving PNGs into an output folder
+    def run_batch():
+        input_dir = filedialog.askdirectory(title="Select Input Folder")
+        if not input_dir:
+            return
+        output_dir = filedialog.askdirectory(title="Select Output Folder")
+        if not output_dir:
+            return
+        if os.path.normcase(os.path.abspath(output_dir)) == os.path.normcase(os.path.abspath(input_dir)):
+            messagebox.showerror("Invalid Output Folder",
+                                 "Please choose an output folder different from the input folder.")
+            return
 
-        # Run conversion
-        try:
-            resize_with_transparent_bg(inp, out, w, h)
-            status_label.config(text="Ready")
-            messagebox.showinfo("Success", f"Image successfully resized!\n\nSaved: {out}\nSize: {w}×{h}px")
-        except Exception as e:
-            status_label.config(text="Error")
-            messagebox.showerror("Error", str(e))
+        names = sorted(
+            name for name in os.listdir(input_dir)
+            if os.path.splitext(name)[1].lower() in INPUT_EXTENSIONS
+        )
+        if not names:
+            messagebox.showerror("No Images", f"No supported images found in:\n{input_dir}")
+            return
+
+        dims = get_dimensions()
+        if dims is None:
+            return
+        w, h = dims
+
+        in_paths = [os.path.join(input_dir, name) for name in names]
+        out_paths = batch_output_paths(in_paths, output_dir)
+
+        # Workers decode one image per core at once, so warn once about large inputs
+        large = [pixels for pixels in map(image_pixels, in_paths) if pixels > LARGE_IMAGE_PIXELS]
+        if large:
+            if not messagebox.askyesno(
+                "Large Images",
+                f"{len(large)} of {len(names)} images are larger than "
+                f"{LARGE_IMAGE_PIXELS // 1_000_000} MP (up to {max(large) / 1_000_000:.0f} MP).\n"
+                "Several may be decoded at once and use a lot of memory.\n\nContinue?"
+            ):
+                return
+
+        status_label.config(text=f"Processing 0/{len(names)}...")
+        progress_bar.config(maximum=len(names), value=0)
+        set_busy(True)
+        compress_level = compress_var.get()
+
+        # The pool is driven from a thread so the Tk loop keeps running;
+        # progress and results are marshalled back with root.after
+        def on_progress(done, total):
+            root.after(0, update_progress, done, total)
+
+        def update_progress(done, total):
+            progress_bar.config(value=done)
+            status_label.config(text=f"Processing {done}/{total}...")
+
+        def worker():
+            try:
+                failures = resize_batch(in_paths, out_paths, w, h, compress_level, on_progress)
+                error = None
+            except Exception as e:
+                failures, error = [], e
+            root.after(0, on_done, failures, error)
+
+        def on_done(failures, error):
+            set_busy(False)
+            if error is not None:
+                status_label.config(text="Error")
+                messagebox.showerror("Error", str(error))
+            elif failures:
+                status_label.config(text="Finished with errors")
+                details = "\n".join(f"{os.path.basename(path)}: {msg}" for path, msg in failures[:10])
+                messagebox.showerror(
+                    "Batch Finished",
+                    f"{len(names) - len(failures)} of {len(names)} images resized.\n\n{details}"
+                )
+            else:
+                status_label.config(text="Ready")
+                messagebox.showinfo(
+                    "Success",
+                    f"{len(names)} images successfully resized!\n\nSaved to: {output_dir}\nSize: {w}×{h}px"
+                )
+
+        threading.Thread(target=worker, daemon=True).start()
 
     # Layout widgets
     # Preset dropdown
     tk.Label(main_frame, text="Format:").grid(row=0, column=0, **pad, sticky="e")
-    preset_menu = tk.OptionMenu(main_frame, preset_var, *PRESETS.keys())
+    preset_menu = tk.OptionMenu(main_frame, preset_var, *_PRESET_KEYS)
     preset_menu.config(width=25)
     preset_menu.grid(row=0, column=1, columnspan=2, **pad, sticky="w")
-    preset_var.trace_add('write', on_preset_change)
+    # Menu entries set the preset index alongside the displayed label
+    for i, label in enumerate(_PRESET_KEYS):
+        preset_menu["menu"].entryconfigure(
+            i, command=lambda i=i, label=label: (preset_var.set(label), preset_idx.set(i)))
+    preset_idx.trace_add('write', on_preset_change)
     on_preset_change()
 
     # Input selection
@@ -182,7 +594,7 @@ def main():
     tk.Button(main_frame, text="Browse…", command=select_input).grid(row=1, column=2, **pad)
 
     # Output selection
-    tk.Label(main_frame, text="Output PNG:").grid(row=2, column=0, **pad, sticky="e")
+    tk.Label(main_frame, text="Output Image:").grid(row=2, column=0, **pad, sticky="e")
     tk.Entry(main_frame, textvariable=output_var, width=40).grid(row=2, column=1, **pad, sticky="ew")
     tk.Button(main_frame, text="Save As…", command=select_output).grid(row=2, column=2, **pad)
 
@@ -196,13 +608,31 @@ def main():
     tk.Label(dims_frame, text="Height:").pack(side=tk.LEFT, padx=(15, 5))
     tk.Entry(dims_frame, textvariable=height_var, width=6, state='readonly').pack(side=tk.LEFT)
 
-    # Convert button
-    tk.Button(main_frame, text="Resize →", command=run_conversion,
-              width=20, bg="#4CAF50", fg="white").grid(row=4, column=0, columnspan=3, pady=12)
+    # PNG compression choice
+    tk.Label(main_frame, text="PNG Output:").grid(row=4, column=0, **pad, sticky="e")
+    compress_frame = tk.Frame(main_frame)
+    compress_frame.grid(row=4, column=1, columnspan=2, **pad, sticky="w")
+    tk.Radiobutton(compress_frame, text="Fast save", variable=compress_var,
+                   value=FAST_COMPRESS_LEVEL).pack(side=tk.LEFT, padx=(0, 15))
+    tk.Radiobutton(compress_frame, text="Small file", variable=compress_var,
+                   value=SMALL_COMPRESS_LEVEL).pack(side=tk.LEFT)
+
+    # Convert buttons
+    buttons_frame = tk.Frame(main_frame)
+    buttons_frame.grid(row=5, column=0, columnspan=3, pady=12)
+    resize_button = tk.Button(buttons_frame, text="Resize →", command=run_conversion,
+                              width=20, bg="#4CAF50", fg="white")
+    resize_button.pack(side=tk.LEFT, padx=(0, 10))
+    batch_button = tk.Button(buttons_frame, text="Batch folder…", command=run_batch, width=20)
+    batch_button.pack(side=tk.LEFT)
+
+    # Batch progress
+    progress_bar = ttk.Progressbar(main_frame, mode="determinate")
+    progress_bar.grid(row=6, column=0, columnspan=3, sticky="ew", **pad)
 
     # Status bar
     status_label = tk.Label(main_frame, text="Ready", bd=1, relief=tk.SUNKEN, anchor=tk.W)
-    status_label.grid(row=5, column=0, columnspan=3, sticky="ew", **pad)
+    status_label.grid(row=7, column=0, columnspan=3, sticky="ew", **pad)
 
     # Make sure columns expand properly
     main_frame.columnconfigure(1, weight=1)